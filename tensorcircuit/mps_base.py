@@ -3,7 +3,7 @@ FiniteMPS from tensornetwork with bug fixed
 """
 # pylint: disable=invalid-name
 
-from typing import Any, Optional, List, Sequence
+from typing import Any, Optional, List, Sequence, Tuple
 
 import numpy as np
 from tensornetwork.linalg.node_linalg import conj
@@ -12,11 +12,129 @@ import tensornetwork.ncon_interface as ncon
 from tensornetwork.network_components import Node
 
 
-from .cons import backend
+from .cons import backend, dtypestr, rdtypestr
 
 Tensor = Any
 
 
+def randomized_svd(
+    matrix: Tensor,
+    max_singular_values: int,
+    oversampling: int = 8,
+    n_iter: int = 2,
+) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    """
+    Truncated SVD of a matrix by randomized range finding (Halko, Martinsson and Tropp, arXiv:0909.4061).
+    The cost is :math:`O(mnk)` instead of :math:`O(mn\\min(m, n))` for the full SVD,
+    where :math:`k` is ``max_singular_values``.
+
+    :param matrix: The matrix to decompose.
+    :type matrix: Tensor
+    :param max_singular_values: The number of singular values to keep.
+    :type max_singular_values: int
+    :param oversampling: The number of extra random vectors for the range finding, defaults to 8
+    :type oversampling: int, optional
+    :param n_iter: The number of power iterations, defaults to 2
+    :type n_iter: int, optional
+    :return: ``U``, ``S``, ``VH`` and the truncation error as a one element tensor,
+        whose square is the discarded weight :math:`\\Vert A\\Vert_F^2-\\sum_i S_i^2`
+    :rtype: Tuple[Tensor, Tensor, Tensor, Tensor]
+    """
+    m, n = matrix.shape
+    l = min(max_singular_values + oversampling, m, n)
+    if l == min(m, n):
+        # the sketch is as large as the matrix itself
+        return backend.svd(matrix, max_singular_values=max_singular_values)  # type: ignore
+    omega = backend.cast(backend.implicit_randn([n, l]), dtypestr)
+    q, _ = backend.qr(backend.matmul(matrix, omega))
+    for _ in range(n_iter):
+        q, _ = backend.qr(backend.matmul(backend.adjoint(matrix), q))
+        q, _ = backend.qr(backend.matmul(matrix, q))
+    u, s, vh, _ = backend.svd(
+        backend.matmul(backend.adjoint(q), matrix),
+        max_singular_values=max_singular_values,
+    )
+    u = backend.matmul(q, u)
+    total = backend.sum(backend.real(matrix * backend.conj(matrix)))
+    kept = backend.sum(backend.real(s) ** 2)
+    err = backend.reshape(backend.sqrt(backend.relu(total - kept)), [1])
+    return u, s, vh, backend.cast(err, dtypestr)
+
+
+def truncated_svd(
+    matrix: Tensor,
+    max_singular_values: Optional[int] = None,
+    max_truncation_err: Optional[float] = None,
+    relative: bool = False,
+    svd_method: str = "svd",
+    fixed_bond_dimension: bool = False,
+) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    """
+    Truncated SVD of a matrix with the given truncation rule.
+
+    :param matrix: The matrix to decompose.
+    :type matrix: Tensor
+    :param max_singular_values: The maximum number of singular values to keep.
+    :type max_singular_values: int, optional
+    :param max_truncation_err: The maximum allowed truncation error.
+    :type max_truncation_err: float, optional
+    :param relative: Multiply `max_truncation_err` with the largest singular value.
+    :type relative: bool, optional
+    :param svd_method: "svd" for the full SVD, or "randomized" for ``randomized_svd``
+        which only works when ``max_singular_values`` is given, defaults to "svd"
+    :type svd_method: str, optional
+    :param fixed_bond_dimension: If True, exactly ``max_singular_values`` singular values
+        (or all of them for a smaller matrix) are kept so that the output shapes only depend on the input shapes,
+        and ``max_truncation_err`` sets the dropped singular values to zero instead of slicing them off,
+        defaults to False
+    :type fixed_bond_dimension: bool, optional
+    :return: ``U``, ``S``, ``VH`` and the discarded singular values (or the truncation error)
+    :rtype: Tuple[Tensor, Tensor, Tensor, Tensor]
+    """
+    if fixed_bond_dimension:
+        u, s, vh, err = truncated_svd(
+            matrix, max_singular_values=max_singular_values, svd_method=svd_method
+        )
+        if max_truncation_err is None:
+            return u, s, vh, err
+        s2 = backend.real(s) ** 2
+        # discarded weight if the singular values from the i-th on are dropped
+        tails = (
+            backend.sum(s2)
+            - backend.cumsum(s2)
+            + s2
+            + backend.sum(backend.real(err * backend.conj(err)))
+        )
+        if relative:
+            max_truncation_err = max_truncation_err * backend.real(s[0])
+        mask = backend.cast(tails > max_truncation_err**2, rdtypestr)
+        # the largest singular value is always kept
+        mask = backend.concat([backend.ones([1], dtype=rdtypestr), mask[1:]])
+        mask = backend.cast(mask, dtypestr)
+        s = backend.cast(s, dtypestr)
+        return u, s * mask, vh, backend.concat([err, s * (1.0 - mask)])
+    if svd_method == "svd" or max_singular_values is None:
+        return backend.svd(  # type: ignore
+            matrix,
+            max_singular_values=max_singular_values,
+            max_truncation_error=max_truncation_err,
+            relative=relative,
+        )
+    if svd_method != "randomized":
+        raise ValueError("Unknown svd method: %s" % svd_method)
+    u, s, vh, err = randomized_svd(matrix, max_singular_values)
+    if max_truncation_err is not None:
+        # further truncation on the kept singular values, the same rule as tn svd
+        sn = np.abs(backend.numpy(s))
+        trunc_errs = np.sqrt(np.cumsum(np.square(sn[::-1])))
+        if relative:
+            max_truncation_err = max_truncation_err * sn[0]
+        keep = max(int(np.count_nonzero(trunc_errs > max_truncation_err)), 1)
+        err = backend.concat([err, s[keep:]])
+        u, s, vh = u[:, :keep], s[:keep], vh[:keep, :]
+    return u, s, vh, err
+
+
 class FiniteMPS(tn.FiniteMPS):  # type: ignore
     center_position: Optional[int]
     # TODO(@SUSYUSTC): Maybe more functions can be put here to disentangle with circuits
@@ -29,6 +147,8 @@ class FiniteMPS(tn.FiniteMPS):  # type: ignore
         max_truncation_err: Optional[float] = None,
         center_position: Optional[int] = None,
         relative: bool = False,
+        svd_method: str = "svd",
+        fixed_bond_dimension: bool = False,
     ) -> Tensor:
         """
         Apply a two-site gate to an MPS. This routine will in general destroy
@@ -56,6 +176,11 @@ class FiniteMPS(tn.FiniteMPS):  # type: ignore
         :type center_position: Optional[int],optional
         :param relative: Multiply `max_truncation_err` with the largest singular value.
         :type relative: bool
+        :param svd_method: "svd" or "randomized", see ``truncated_svd``
+        :type svd_method: str
+        :param fixed_bond_dimension: Keep exactly ``max_singular_values`` singular values,
+            see ``truncated_svd``
+        :type fixed_bond_dimension: bool
         :raises ValueError: "rank of gate is {} but has to be 4", "site1 = {} is not between 0 <= site < N - 1 = {}",
             "site2 = {} is not between 1 <= site < N = {}","Found site2 ={}, site1={}. Only nearest
             neighbor gates are currently supported",
@@ -128,13 +253,17 @@ class FiniteMPS(tn.FiniteMPS):  # type: ignore
             center_position = site1
 
         if use_svd:
-            U, S, V, tw = self.backend.svd(
-                tensor,
-                pivot_axis=2,
+            d0, d1, d2, d3 = tensor.shape
+            U, S, V, tw = truncated_svd(
+                self.backend.reshape(tensor, [d0 * d1, d2 * d3]),
                 max_singular_values=max_singular_values,
-                max_truncation_error=max_truncation_err,
+                max_truncation_err=max_truncation_err,
                 relative=relative,
+                svd_method=svd_method,
+                fixed_bond_dimension=fixed_bond_dimension,
             )
+            U = self.backend.reshape(U, [d0, d1, -1])
+            V = self.backend.reshape(V, [-1, d2, d3])
             # Note: fix the center position bug here
             if center_position == site2:
                 left_tensor = U
@@ -4,19 +4,19 @@ Quantum circuit: MPS state simulator
 # pylint: disable=invalid-name
 
 from functools import reduce
-from typing import Any, Callable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
+import tensornetwork as tn
 
 from . import gates
-from .cons import backend, npdtype
-from .mps_base import FiniteMPS
+from .cons import backend, npdtype, dtypestr, rdtypestr
+from .mps_base import FiniteMPS, truncated_svd
+from .quantum import QuOperator, _mpo_tensors
 
 Gate = gates.Gate
 Tensor = Any
 
-# TODO(@refraction-ray): support Circuit IR for MPSCircuit
-
 
 def split_tensor(
     tensor: Tensor,
@@ -24,6 +24,7 @@ def split_tensor(
     max_singular_values: Optional[int] = None,
     max_truncation_err: Optional[float] = None,
     relative: bool = True,
+    svd_method: str = "svd",
 ) -> Tuple[Tensor, Tensor]:
     """
     Split the tensor by SVD or QR depends on whether a truncation is required.
@@ -38,17 +39,22 @@ def split_tensor(
     :type max_truncation_err: float, optional
     :param relative: Multiply `max_truncation_err` with the largest singular value.
     :type relative: bool, optional
+    :param svd_method: "svd" for the full SVD, or "randomized" for the randomized SVD
+        targeting ``max_singular_values``, which is much cheaper when the bond dimension is large,
+        see ``mps_base.truncated_svd``, defaults to "svd"
+    :type svd_method: str, optional
     :return: Two tensors after splitting
     :rtype: Tuple[Tensor, Tensor]
     """
     # The behavior is a little bit different from tn.split_node because it explicitly requires a center
     svd = (max_truncation_err is not None) or (max_singular_values is not None)
     if svd:
-        U, S, VH, _ = backend.svd(
+        U, S, VH, _ = truncated_svd(
             tensor,
             max_singular_values=max_singular_values,
-            max_truncation_error=max_truncation_err,
+            max_truncation_err=max_truncation_err,
             relative=relative,
+            svd_method=svd_method,
         )
         if left:
             return backend.matmul(U, backend.diagflat(S)), VH
@@ -61,6 +67,37 @@ def split_tensor(
             return backend.qr(tensor)  # type: ignore
 
 
+def _gate_to_mpo(gate: Tensor, index: Sequence[int]) -> Tuple[List[Tensor], List[int]]:
+    """
+    Split a gate into MPO tensors by sequential SVDs,
+    only the singular values at the level of numerical noise are dropped.
+
+    :param gate: The gate tensor with legs [out_1, ..., out_m, in_1, ..., in_m]
+    :type gate: Tensor
+    :param index: Qubit indices of the gate
+    :type index: Sequence[int]
+    :return: MPO tensors with legs [k_left, out, in, k_right] and the sorted qubit indices
+    :rtype: Tuple[List[Tensor], List[int]]
+    """
+    m = len(index)
+    gate = backend.cast(backend.reshape2(gate), dtypestr)
+    perm = []
+    for i in np.argsort(index):
+        perm += [int(i), int(i) + m]
+    t = backend.reshape(backend.transpose(gate, perm), [1, -1])
+    eps = 1e-12 if dtypestr == "complex128" else 1e-6
+    mpo = []
+    for _ in range(m - 1):
+        k = t.shape[0]
+        u, s, vh, _ = backend.svd(
+            backend.reshape(t, [k * 4, -1]), max_truncation_error=eps, relative=True
+        )
+        mpo.append(backend.reshape(u, [k, 2, 2, -1]))
+        t = backend.matmul(backend.diagflat(s), vh)
+    mpo.append(backend.reshape(t, [-1, 2, 2, 1]))
+    return mpo, sorted(index)
+
+
 class MPSCircuit:
     """
     ``MPSCircuit`` class.
@@ -118,6 +155,7 @@ class MPSCircuit:
         self._nqubits = nqubits
         self._fidelity = 1.0
         self.set_truncation_rule()
+        self.set_long_range_method()
 
     # `MPSCircuit` does not has `replace_inputs` like `Circuit`
     # because the gates are immediately absorted into the MPS when applied,
@@ -128,25 +166,96 @@ class MPSCircuit:
         max_singular_values: Optional[int] = None,
         max_truncation_err: Optional[float] = None,
         relative: bool = False,
+        svd_method: str = "svd",
+        fixed_bond_dimension: bool = False,
     ) -> None:
         """
         Set truncation rules when double qubit gates are applied.
         If nothing is specified, no truncation will take place and the bond dimension will keep growing.
         For more details, refer to `split_tensor`.
 
+        With ``fixed_bond_dimension=True``, the bond between qubit :math:`i-1` and :math:`i` is zero padded
+        to :math:`\\min(\\chi, 2^i, 2^{n-i})` with :math:`\\chi` = ``max_singular_values`` and stays so
+        after every gate, while ``max_truncation_err`` only zeros out the dropped singular values.
+        The tensor shapes are then independent of the data, so that a function building the circuit
+        can be jitted and vmapped as a whole.
+
+        :Example:
+
+        >>> def f(param):
+        ...     mps = tc.MPSCircuit(4)
+        ...     mps.set_truncation_rule(max_singular_values=2, fixed_bond_dimension=True)
+        ...     for i in range(4):
+        ...         mps.rx(i, theta=param[i])
+        ...     for i in range(3):
+        ...         mps.cnot(i, i + 1)
+        ...     return tc.backend.real(mps.expectation_single_gate(tc.gates.z(), 3))
+        >>> vf = tc.backend.jit(tc.backend.vmap(f))
+
         :param max_singular_values: The maximum number of singular values to keep.
         :type max_singular_values: int, optional
         :param max_truncation_err: The maximum allowed truncation error.
         :type max_truncation_err: float, optional
         :param relative: Multiply `max_truncation_err` with the largest singular value.
         :type relative: bool, optional
+        :param svd_method: "svd" or "randomized", the latter requires ``max_singular_values``
+            and reduces the cost of each truncation at large bond dimension, defaults to "svd"
+        :type svd_method: str, optional
+        :param fixed_bond_dimension: Keep the bond dimensions fixed, which requires ``max_singular_values``,
+            defaults to False
+        :type fixed_bond_dimension: bool, optional
+        :raises ValueError: "`fixed_bond_dimension` requires `max_singular_values`"
         """
+        if svd_method not in ["svd", "randomized"]:
+            raise ValueError("Unknown svd method: %s" % svd_method)
+        if fixed_bond_dimension and max_singular_values is None:
+            raise ValueError("`fixed_bond_dimension` requires `max_singular_values`")
         self.max_singular_values = max_singular_values
         self.max_truncation_err = max_truncation_err
         self.relative = relative
+        self.svd_method = svd_method
+        self.fixed_bond_dimension = fixed_bond_dimension
         self.do_truncation = (self.max_singular_values is not None) or (
             self.max_truncation_err is not None
         )
+        if fixed_bond_dimension:
+            self._pad_bonds()
+
+    def _pad_bonds(self) -> None:
+        """
+        Zero pad the bonds to the dimensions of the fixed bond dimension mode.
+        Once the bonds are padded, the QR steps and the SVDs truncated to ``max_singular_values``
+        keep the dimensions unchanged.
+        """
+        n = self._nqubits
+        dims = [min(self.max_singular_values, 2 ** min(i, n - i)) for i in range(n + 1)]
+        tensors = self._mps.tensors
+        for i in range(n):
+            dl, _, dr = tensors[i].shape
+            if dl > dims[i] or dr > dims[i + 1]:
+                raise ValueError(
+                    "The bond dimension of the MPS exceeds `max_singular_values`"
+                )
+            if (dl, dr) != (dims[i], dims[i + 1]):
+                tensors[i] = backend.einsum(
+                    "Ll,lsr,rR->LsR",
+                    backend.eye(dims[i], dtype=dtypestr, M=dl),
+                    tensors[i],
+                    backend.eye(dr, dtype=dtypestr, M=dims[i + 1]),
+                )
+
+    def set_long_range_method(self, method: str = "swap") -> None:
+        """
+        Set how double qubit gates on non-adjacent qubits are applied by ``apply_double_gate``.
+
+        :param method: "swap" moves the two qubits together by a chain of SWAP gates,
+            "mpo" applies the gate as an MPO over the span, see ``apply_double_gate_mpo``,
+            defaults to "swap"
+        :type method: str, optional
+        """
+        if method not in ["swap", "mpo"]:
+            raise ValueError("Unknown long range method: %s" % method)
+        self.long_range_method = method
 
     # TODO(@refraction-ray): unified split truncation API between Circuit and MPSCircuit
 
@@ -276,6 +385,8 @@ class MPSCircuit:
             max_singular_values=self.max_singular_values,
             max_truncation_err=self.max_truncation_err,
             relative=self.relative,
+            svd_method=self.svd_method,
+            fixed_bond_dimension=self.fixed_bond_dimension,
         )
         self._fidelity *= 1 - backend.real(backend.sum(err**2))
 
@@ -295,6 +406,12 @@ class MPSCircuit:
         :param index2: The second qubit index of the gate
         :type index2: int
         """
+        if abs(index2 - index1) > 1 and self.long_range_method == "mpo":
+            self.apply_mpo_gate(gate, index1, index2)
+            return
+        if index1 > index2:
+            gate = Gate(backend.transpose(gate.tensor, [1, 0, 3, 2]))
+            index1, index2 = index2, index1
         # Equivalent to apply N SWPA gates, the required gate, N SWAP gates sequentially on adjacent gates
         diff1 = abs(index1 - self._mps.center_position)  # type: ignore
         diff2 = abs(index2 - self._mps.center_position)  # type: ignore
@@ -325,14 +442,163 @@ class MPSCircuit:
                     gates.swap(), index, index + 1, center_position=index + 1  # type: ignore
                 )
 
+    def apply_double_gate_mpo(
+        self,
+        gate: Gate,
+        index1: int,
+        index2: int,
+    ) -> None:
+        """
+        Apply a double qubit gate on MPS as an MPO of bond dimension :math:`\\leq 4`.
+        The gate is split by SVD into a sum of direct products, the MPO is contracted into the MPS
+        on all sites between ``index1`` and ``index2`` at once, and the enlarged bonds are compressed
+        with one QR sweep and one truncation sweep. Compared with the SWAP chain in ``apply_double_gate``,
+        each bond in the span is only truncated once.
+        Truncation rule is specified by `set_truncation_rule`.
+
+        :param gate: The Gate to be applied
+        :type gate: Gate
+        :param index1: The first qubit index of the gate
+        :type index1: int
+        :param index2: The second qubit index of the gate
+        :type index2: int
+        """
+        if abs(index2 - index1) == 1:
+            self.apply_double_gate(gate, index1, index2)
+            return
+        self.apply_mpo_gate(gate, index1, index2)
+
+    def apply_mpo_gate(self, gate: Gate, *index: int) -> None:
+        """
+        Apply a gate on any number of qubits as an MPO.
+        The gate is split into an MPO by sequential SVDs, the MPO is contracted into the MPS
+        on all sites spanned by ``index`` at once, and the enlarged bonds are compressed
+        with one QR sweep and one truncation sweep.
+        Truncation rule is specified by `set_truncation_rule`.
+
+        :param gate: The Gate to be applied
+        :type gate: Gate
+        :param index: Qubit indices of the gate
+        :type index: int
+        """
+        mpo, sites = _gate_to_mpo(gate.tensor, index)
+        start, end = sites[0], sites[-1]
+        self.position(start)
+        tensors = self._mps.tensors
+        wmap = dict(zip(sites, mpo))
+        k = 1
+        for i in range(start, end + 1):
+            w = wmap.get(i, None)
+            if w is None:
+                # identity on the physical leg, the MPO bond is passed through
+                t = backend.einsum(
+                    "lsr,kK->lksrK", tensors[i], backend.eye(k, dtype=dtypestr)
+                )
+            else:
+                # w: [k_left, out, in, k_right]
+                t = backend.einsum("kcaK,lar->lkcrK", w, tensors[i])
+            t0, t1, t2, t3, t4 = t.shape
+            tensors[i] = backend.reshape(t, [t0 * t1, t2, t3 * t4])
+            k = t4
+        # the left part is isometric, move the center to the end without truncation
+        for i in range(start, end):
+            t0, t1, t2 = tensors[i].shape
+            q, r = split_tensor(backend.reshape(tensors[i], [t0 * t1, t2]), left=False)
+            tensors[i] = backend.reshape(q, [t0, t1, -1])
+            tensors[i + 1] = backend.einsum("ij,jak->iak", r, tensors[i + 1])
+        # compress the bonds back to the start
+        for i in range(end, start, -1):
+            t0, t1, t2 = tensors[i].shape
+            r, q = self._split_matrix(
+                backend.reshape(tensors[i], [t0, t1 * t2]), left=True
+            )
+            tensors[i] = backend.reshape(q, [-1, t1, t2])
+            tensors[i - 1] = backend.einsum("iaj,jk->iak", tensors[i - 1], r)
+        self._mps.center_position = start
+
+    def _split_matrix(self, matrix: Tensor, left: bool = True) -> Tuple[Tensor, Tensor]:
+        """
+        Split a matrix with the truncation rule of the circuit,
+        the truncation error is recorded in the fidelity estimation.
+        For more details, refer to `split_tensor`.
+        """
+        if not self.do_truncation:
+            return split_tensor(matrix, left=left)
+        U, S, VH, err = truncated_svd(
+            matrix,
+            max_singular_values=self.max_singular_values,
+            max_truncation_err=self.max_truncation_err,
+            relative=self.relative,
+            svd_method=self.svd_method,
+            fixed_bond_dimension=self.fixed_bond_dimension,
+        )
+        self._fidelity *= 1 - backend.real(backend.sum(err**2))
+        if left:
+            return backend.matmul(U, backend.diagflat(S)), VH
+        else:
+            return U, backend.matmul(backend.diagflat(S), VH)
+
+    def apply_layer(
+        self,
+        gates: Union[Gate, Sequence[Gate]],
+        pairs: Sequence[Tuple[int, int]],
+    ) -> None:
+        """
+        Apply a layer of double qubit gates on disjoint pairs of adjacent qubits, e.g. a brickwork layer.
+        Since the gates commute with each other, they are applied in one sweep
+        starting from the end closer to the current center,
+        and the orthogonality center is carried along by the gates
+        so that only one QR step is needed between neighboring pairs.
+        Truncation rule is specified by `set_truncation_rule`.
+
+        :Example:
+
+        >>> mps = tc.MPSCircuit(6)
+        >>> mps.apply_layer(tc.gates.cnot(), [(0, 1), (2, 3), (4, 5)])
+        >>> mps.apply_layer([tc.gates.cz(), tc.gates.cz()], [(1, 2), (3, 4)])
+
+        :param gates: The gates to be applied, or one gate applied on all pairs
+        :type gates: Union[Gate, Sequence[Gate]]
+        :param pairs: Qubit indices for each gate
+        :type pairs: Sequence[Tuple[int, int]]
+        :raises ValueError: "`apply_layer` only supports gates on disjoint adjacent qubits"
+        """
+        if isinstance(gates, tn.Node):
+            gates = [gates for _ in pairs]
+        assert len(gates) == len(pairs)
+        items = []
+        for gate, (index1, index2) in zip(gates, pairs):
+            if index1 > index2:
+                gate = Gate(backend.transpose(gate.tensor, [1, 0, 3, 2]))
+                index1, index2 = index2, index1
+            items.append((index1, index2, gate))
+        items.sort(key=lambda item: item[0])
+        for k, (index1, index2, _) in enumerate(items):
+            if index2 - index1 != 1 or (k > 0 and index1 <= items[k - 1][1]):
+                raise ValueError(
+                    "`apply_layer` only supports gates on disjoint adjacent qubits"
+                )
+        if not items:
+            return
+        center = self._mps.center_position
+        if abs(center - items[0][0]) > abs(center - items[-1][1]):  # type: ignore
+            for index1, index2, gate in items[::-1]:
+                self.apply_adjacent_double_gate(
+                    gate, index1, index2, center_position=index1
+                )
+        else:
+            for index1, index2, gate in items:
+                self.apply_adjacent_double_gate(
+                    gate, index1, index2, center_position=index2
+                )
+
     def apply_general_gate(self, gate: Gate, *index: int) -> None:
         """
         Apply a general qubit gate on MPS.
 
         :param gate: The Gate to be applied
         :type gate: Gate
-        :raises ValueError: "MPS does not support application of gate on > 2 qubits."
-        :param index: Qubit indices of the gate
+        :param index: Qubit indices of the gate, gates on > 2 qubits are applied as MPO
         :type index: int
         """
         assert len(index) == len(set(index))
@@ -341,9 +607,8 @@ class MPSCircuit:
             self.apply_single_gate(gate, *index)
         elif noe == 2:
             self.apply_double_gate(gate, *index)
-
         else:
-            raise ValueError("MPS does not support application of gate on > 2 qubits")
+            self.apply_mpo_gate(gate, *index)
 
     apply = apply_general_gate
 
@@ -436,8 +701,94 @@ class MPSCircuit:
             tensors.insert(0, backend.reshape(Q, (-1, 2, nright)))
             if wavefunction.shape == (1, 1):
                 break
+        # keep the global phase of the wavefunction, the norm is dropped as before
+        phase = wavefunction / backend.cast(backend.abs(wavefunction), dtypestr)
+        tensors[0] = tensors[0] * backend.reshape(phase, [1, 1, 1])
         return MPSCircuit(len(tensors), tensors=tensors)
 
+    @staticmethod
+    def from_circuit(
+        c: Any,
+        max_singular_values: Optional[int] = None,
+        max_truncation_err: Optional[float] = None,
+        relative: bool = False,
+        svd_method: str = "svd",
+        long_range_method: str = "swap",
+    ) -> "MPSCircuit":
+        """
+        Construct the MPS from a ``Circuit`` by replaying its intermediate representation
+        with compression on the fly, the dense wavefunction is never formed
+        (unless the circuit itself is built on a dense input state).
+        The truncation fidelity is tracked in ``_fidelity`` as usual.
+        Note that only the gates recorded in the IR are replayed,
+        operations outside the IR such as ``mid_measurement`` and Kraus channels are not supported.
+
+        :Example:
+
+        >>> c = tc.Circuit(3)
+        >>> c.H(0)
+        >>> c.toffoli(0, 2, 1)
+        >>> mps = tc.MPSCircuit.from_circuit(c, max_singular_values=16)
+        >>> mps.expectation_single_gate(tc.gates.z(), 1)
+        array(0.+0.j, dtype=complex64)
+
+        :param c: The circuit to convert
+        :type c: Circuit
+        :param max_singular_values: The maximum number of singular values to keep.
+        :type max_singular_values: int, optional
+        :param max_truncation_err: The maximum allowed truncation error.
+        :type max_truncation_err: float, optional
+        :param relative: Multiply `max_truncation_err` with the largest singular value.
+        :type relative: bool, optional
+        :param svd_method: "svd" or "randomized", see ``set_truncation_rule``
+        :type svd_method: str, optional
+        :param long_range_method: "swap" or "mpo", see ``set_long_range_method``
+        :type long_range_method: str, optional
+        :raises ValueError: "`from_circuit` doesn't support circuits with MPS inputs"
+        :return: The constructed MPS
+        :rtype: MPSCircuit
+        """
+        n = c._nqubits
+        input_nodes = c._nodes[: c._start_index]
+        if c.has_inputs:
+            inputs = input_nodes[0].tensor
+            if len(inputs.shape) != n:
+                raise ValueError(
+                    "`from_circuit` doesn't support inputs of %s qubits"
+                    % len(inputs.shape)
+                )
+            mps = MPSCircuit.from_wavefunction(
+                inputs,
+                max_singular_values=max_singular_values,
+                max_truncation_err=max_truncation_err,
+                relative=relative,
+            )
+        elif [node.name for node in input_nodes] == [
+            "qb-%s" % (i + 1) for i in range(n)
+        ]:
+            mps = MPSCircuit(
+                n,
+                tensors=[
+                    backend.reshape(backend.cast(node.tensor, dtypestr), [1, 2, 1])
+                    for node in input_nodes
+                ],
+            )
+        else:
+            raise ValueError("`from_circuit` doesn't support circuits with MPS inputs")
+        mps.set_truncation_rule(
+            max_singular_values=max_singular_values,
+            max_truncation_err=max_truncation_err,
+            relative=relative,
+            svd_method=svd_method,
+        )
+        mps.set_long_range_method(long_range_method)
+        for d in c.to_qir():
+            gate = d["gate"]
+            if d["mpo"]:
+                gate = Gate(backend.reshape2(gate.eval_matrix()))
+            mps.apply_general_gate(gate, *d["index"])
+        return mps
+
     def wavefunction(self, form: str = "default") -> Tensor:
         """
         Compute the output wavefunction from the circuit.
@@ -566,6 +917,58 @@ class MPSCircuit:
         else:
             return sample, -1
 
+    def sample(self, shots: int = 1, with_prob: bool = False) -> Tuple[Tensor, Tensor]:
+        """
+        Perfect sampling of bitstrings on all qubits in the computational basis.
+        The MPS is brought into the right canonical form once,
+        and all shots are then drawn in a single left to right sweep
+        with the conditional probabilities batched over shots.
+
+        :Example:
+
+        >>> mps = tc.MPSCircuit(3)
+        >>> mps.H(0)
+        >>> mps.CNOT(0, 1)
+        >>> mps.sample(4)
+        (array([[1, 1, 0],
+                [0, 0, 0],
+                [0, 0, 0],
+                [1, 1, 0]], dtype=int32), -1.0)
+
+        :param shots: The number of bitstrings to draw, defaults to 1
+        :type shots: int, optional
+        :param with_prob: If true, theoretical probability of each bitstring is also returned.
+        :type with_prob: bool, optional
+        :return: The int tensor of samples in shape [shots, nqubits]
+            and the probabilities in shape [shots] (optional)
+        :rtype: Tuple[Tensor, Tensor]
+        """
+        # the center is moved in place, which doesn't change the state
+        self.position(0)
+        # all tensors right to the center are right isometric,
+        # so the conditional probability only depends on the left environment of each shot
+        env = backend.ones([shots, 1], dtype=dtypestr)
+        p = backend.ones([shots], dtype=rdtypestr)
+        samples = []
+        for tensor in self._mps.tensors:
+            w = backend.einsum("ni,iaj->naj", env, tensor)
+            probs = backend.sum(backend.real(w * backend.conj(w)), axis=2)
+            norm = probs[:, 0] + probs[:, 1]
+            p0 = probs[:, 0] / norm
+            r = backend.implicit_randu([shots], dtype=rdtypestr)
+            choice = backend.cast(r >= p0, rdtypestr)
+            pc = p0 + choice * (1.0 - 2.0 * p0)
+            p = p * pc
+            choicec = backend.cast(choice, dtypestr)[:, None]
+            env = (1.0 - choicec) * w[:, 0, :] + choicec * w[:, 1, :]
+            env = env / backend.cast(backend.sqrt(pc * norm), dtypestr)[:, None]
+            samples.append(choice)
+        sample = backend.cast(backend.stack(samples, axis=1), "int32")
+        if with_prob:
+            return sample, p
+        else:
+            return sample, -1.0
+
     def proj_with_mps(self, other: "MPSCircuit") -> Tensor:
         """
         Compute the projection between `other` as bra and `self` as ket.
@@ -598,9 +1001,102 @@ class MPSCircuit:
         result = backend.sum(bra_A * ket_A)
         return backend.convert_to_tensor(result)
 
+    def _envs(self) -> Tuple[List[Tensor], List[Tensor]]:
+        """
+        Left and right environments of the MPS :math:`\\langle\\psi\\vert\\psi\\rangle` at each site.
+        ``lenvs[i]`` contracts all sites before ``i`` and ``renvs[i]`` all sites after ``i``,
+        with the ket bond as the first index and the bra bond as the second index.
+        The environments are cached and only recomputed when the tensors of the MPS are changed.
+
+        :return: The list of left environments and the list of right environments
+        :rtype: Tuple[List[Tensor], List[Tensor]]
+        """
+        tensors = self._mps.tensors
+        cache = getattr(self, "_env_cache", None)
+        # the cache holds references to the tensors, so the identity check is safe
+        if (
+            cache is not None
+            and len(cache[0]) == len(tensors)
+            and all([a is b for a, b in zip(cache[0], tensors)])
+        ):
+            return cache[1], cache[2]
+        lenvs = [backend.ones([1, 1], dtype=dtypestr)]
+        for tensor in tensors[:-1]:
+            lenvs.append(_transfer_left(lenvs[-1], tensor))
+        renvs = [backend.ones([1, 1], dtype=dtypestr)]
+        for tensor in tensors[:0:-1]:
+            renvs.append(_transfer_right(renvs[-1], tensor))
+        renvs = renvs[::-1]
+        self._env_cache = (list(tensors), lenvs, renvs)
+        return lenvs, renvs
+
+    def _local_ops(
+        self, ops: Sequence[Tuple[Gate, List[int]]]
+    ) -> Optional[Dict[int, Tensor]]:
+        """
+        Arrange operators on single sites or adjacent site pairs by their leftmost site.
+
+        :return: Map from the leftmost site to the operator tensor,
+            None if any operator is not local or two operators overlap
+        :rtype: Optional[Dict[int, Tensor]]
+        """
+        opmap: Dict[int, Tensor] = {}
+        occupied: Set[int] = set()
+        for op, index in ops:
+            if isinstance(index, int):
+                index = [index]
+            index = list(index)
+            if isinstance(op, tn.Node):
+                op = op.tensor
+            op = backend.cast(backend.reshape2(op), dtypestr)
+            if len(index) == 2 and index[0] - index[1] == 1:
+                op = backend.transpose(op, [1, 0, 3, 2])
+                index = index[::-1]
+            if len(index) > 2 or (len(index) == 2 and index[1] - index[0] != 1):
+                return None
+            if occupied.intersection(index):
+                return None
+            occupied.update(index)
+            opmap[index[0]] = op
+        return opmap
+
+    def _expectation_local_ops(self, opmap: Dict[int, Tensor]) -> Tensor:
+        """
+        Contract :math:`\\langle\\psi\\vert O\\vert\\psi\\rangle` between the cached environments,
+        only the sites spanned by the operators are swept.
+        """
+        tensors = self._mps.tensors
+        lenvs, renvs = self._envs()
+        if not opmap:
+            return backend.sum(_transfer_left(lenvs[-1], tensors[-1]))
+        start = min(opmap)
+        end = max([s + len(op.shape) // 2 - 1 for s, op in opmap.items()])
+        env = lenvs[start]
+        i = start
+        while i <= end:
+            op = opmap.get(i, None)
+            if op is None:
+                env = _transfer_left(env, tensors[i])
+                i += 1
+            elif len(op.shape) == 2:
+                x = backend.einsum("kb,kaK->baK", env, tensors[i])
+                x = backend.einsum("ca,baK->bcK", op, x)
+                env = backend.einsum("bcK,bcB->KB", x, backend.conj(tensors[i]))
+                i += 1
+            else:
+                x = backend.einsum("kb,kaK->baK", env, tensors[i])
+                x = backend.einsum("baK,KeM->baeM", x, tensors[i + 1])
+                x = backend.einsum("cdae,baeM->bcdM", op, x)
+                x = backend.einsum("bcdM,bcB->BdM", x, backend.conj(tensors[i]))
+                env = backend.einsum("BdM,BdN->MN", x, backend.conj(tensors[i + 1]))
+                i += 2
+        return backend.sum(env * renvs[end])
+
     def general_expectation(self, *ops: Tuple[Gate, List[int]]) -> Tensor:
         """
         Compute the expectation of corresponding operators in the form of tensor.
+        If all operators act on single sites or adjacent sites, the cached environments are used
+        and only the sites spanned by the operators are contracted.
 
         :param ops: Operator and its position on the circuit,
             eg. ``(gates.Z(), [1]), (gates.X(), [2])`` is for operator :math:`Z_1X_2`
@@ -608,6 +1104,9 @@ class MPSCircuit:
         :return: The expectation of corresponding operators
         :rtype: Tensor
         """
+        opmap = self._local_ops(ops)
+        if opmap is not None:
+            return backend.convert_to_tensor(self._expectation_local_ops(opmap))
         # A better idea is to create a MPO class and have a function to transform gates to MPO
         mpscircuit = self.copy()
         for gate, index in ops:
@@ -615,6 +1114,77 @@ class MPSCircuit:
         value = mpscircuit.proj_with_mps(self)
         return backend.convert_to_tensor(value)
 
+    def expectation_batch(
+        self, ops_list: Sequence[Sequence[Tuple[Gate, List[int]]]]
+    ) -> Tensor:
+        """
+        Compute the expectations of a list of operator products in one go.
+        The left and right environments are computed once in an O(n) sweep,
+        so that each local term only costs the contraction of the sites it spans.
+
+        :Example:
+
+        >>> mps = tc.MPSCircuit(3)
+        >>> mps.H(0)
+        >>> mps.CNOT(0, 1)
+        >>> z = tc.gates.z()
+        >>> mps.expectation_batch([[(z, [0])], [(z, [0]), (z, [1])], [(tc.gates.x(), [2])]])
+        array([0.+0.j, 1.+0.j, 0.+0.j], dtype=complex64)
+
+        :param ops_list: A list of terms, each term is a sequence of operators and their positions
+            in the same format as the arguments of ``general_expectation``
+        :type ops_list: Sequence[Sequence[Tuple[Gate, List[int]]]]
+        :return: The expectations in shape [len(ops_list)]
+        :rtype: Tensor
+        """
+        return backend.stack([self.general_expectation(*ops) for ops in ops_list])
+
+    def expectation_mpo(self, mpo: QuOperator) -> Tensor:
+        """
+        Compute the expectation of an operator in MPO form, e.g. a Hamiltonian from ``quantum.tn2qop``,
+        by one left-to-right zipper contraction of bra-MPO-ket with cost :math:`O(n\\chi^3D)`.
+        The partial environments are cached for the given ``mpo``,
+        so that after local updates of the MPS only the sites from the first changed one are contracted again.
+
+        :Example:
+
+        >>> tfi = tn.matrixproductstates.mpo.FiniteTFI(np.ones([2]), -np.ones([3]), dtype=np.complex64)
+        >>> mpo = tc.quantum.tn2qop(tfi)
+        >>> mps = tc.MPSCircuit(3)
+        >>> mps.expectation_mpo(mpo)
+        array(3.+0.j, dtype=complex64)
+        >>> mps.x(2)
+        >>> mps.expectation_mpo(mpo)  # only the last site is contracted
+        array(1.+0.j, dtype=complex64)
+
+        :param mpo: The MPO with open boundary on all qubits of the circuit
+        :type mpo: QuOperator
+        :raises ValueError: "The MPO acts on {} qubits instead of {}"
+        :return: The expectation value
+        :rtype: Tensor
+        """
+        tensors = self._mps.tensors
+        cache = getattr(self, "_mpo_env_cache", None)
+        if cache is not None and cache[0] is mpo:
+            _, ws, snapshot, lenvs = cache
+            start = 0
+            while start < len(tensors) and snapshot[start] is tensors[start]:
+                start += 1
+            lenvs = lenvs[: start + 1]
+        else:
+            ws = _mpo_tensors(mpo)
+            if len(ws) != self._nqubits:
+                raise ValueError(
+                    "The MPO acts on %s qubits instead of %s" % (len(ws), self._nqubits)
+                )
+            start = 0
+            lenvs = [backend.ones([1, 1, 1], dtype=dtypestr)]
+        for i in range(start, len(tensors)):
+            lenvs.append(_transfer_mpo_left(lenvs[i], tensors[i], ws[i]))
+        # the cache holds references to the tensors, so the identity check is safe
+        self._mpo_env_cache = (mpo, ws, list(tensors), lenvs)
+        return backend.reshape(lenvs[-1], [])
+
     def expectation_single_gate(
         self,
         gate: Gate,
@@ -630,8 +1200,7 @@ class MPSCircuit:
         :return: The expectation of the corresponding single qubit gate
         :rtype: Tensor
         """
-        value = self._mps.measure_local_operator([gate.tensor], [site])[0]
-        return backend.convert_to_tensor(value)
+        return self.general_expectation((gate, [site]))
 
     def expectation_double_gates(
         self,
@@ -648,6 +1217,8 @@ class MPSCircuit:
         :param site: qubit index of the gate
         :type site: int
         """
+        if abs(site1 - site2) == 1:
+            return self.general_expectation((gate, [site1, site2]))
         mps = self.copy()
         # disable truncation
         mps.set_truncation_rule()
@@ -671,10 +1242,177 @@ class MPSCircuit:
         :return: The correlation of the corresponding two qubit gates
         :rtype: Tensor
         """
-        value = self._mps.measure_two_body_correlator(
-            gate1.tensor, gate2.tensor, site1, [site2]
-        )[0]
-        return backend.convert_to_tensor(value)
+        return self.general_expectation((gate1, [site1]), (gate2, [site2]))
+
+
+def _transfer_left(env: Tensor, tensor: Tensor) -> Tensor:
+    x = backend.einsum("kb,kaK->baK", env, tensor)
+    return backend.einsum("baK,baB->KB", x, backend.conj(tensor))
+
+
+def _transfer_right(env: Tensor, tensor: Tensor) -> Tensor:
+    x = backend.einsum("KB,kaK->kaB", env, tensor)
+    return backend.einsum("kaB,baB->kb", x, backend.conj(tensor))
+
+
+def _transfer_mpo_left(env: Tensor, tensor: Tensor, w: Tensor) -> Tensor:
+    x = backend.einsum("akA,asb->kAsb", env, tensor)
+    x = backend.einsum("kAsb,kSsK->AbSK", x, w)
+    return backend.einsum("AbSK,ASB->bKB", x, backend.conj(tensor))
+
+
+def _transfer_mpo_right(env: Tensor, tensor: Tensor, w: Tensor) -> Tensor:
+    x = backend.einsum("bKB,asb->asKB", env, tensor)
+    x = backend.einsum("asKB,kSsK->akSB", x, w)
+    return backend.einsum("akSB,ASB->akA", x, backend.conj(tensor))
+
+
+def _lanczos_ground(
+    matvec: Callable[[Tensor], Tensor],
+    v0: Tensor,
+    num_krylov_vecs: int = 20,
+    tol: float = 1e-10,
+) -> Tuple[float, Tensor]:
+    """
+    The lowest eigenpair of a hermitian operator in the Krylov space started from ``v0``,
+    the Lanczos vectors are fully reorthogonalized (twice),
+    and the iteration stops once the lowest Ritz value converges within ``tol``.
+    """
+    vs = [v0 / backend.norm(v0)]
+    alphas: List[float] = []
+    betas: List[float] = []
+    e0 = None
+    for j in range(num_krylov_vecs):
+        w = matvec(vs[j])
+        alpha = backend.real(backend.sum(backend.conj(vs[j]) * w))
+        alphas.append(float(backend.numpy(alpha)))
+        t = np.diag(alphas) + np.diag(betas, 1) + np.diag(betas, -1)
+        e, y = np.linalg.eigh(t)
+        if e0 is not None and abs(e[0] - e0) < tol:
+            break
+        e0 = e[0]
+        # twice is enough for the orthogonality at small beta
+        for _ in range(2):
+            for v in vs:
+                w = w - backend.sum(backend.conj(v) * w) * v
+        beta = float(backend.numpy(backend.norm(w)))
+        if beta < tol or j == num_krylov_vecs - 1:
+            break
+        betas.append(beta)
+        vs.append(w / beta)
+    v = reduce(lambda a, b: a + b, [yi * vi for yi, vi in zip(y[:, 0], vs)])
+    return e[0], v / backend.norm(v)
+
+
+def dmrg(
+    mpo: QuOperator,
+    max_singular_values: int = 32,
+    max_truncation_err: Optional[float] = None,
+    num_sweeps: int = 10,
+    tol: float = 1e-8,
+    num_krylov_vecs: int = 20,
+    initial_state: Optional[MPSCircuit] = None,
+) -> Tuple[Tensor, MPSCircuit]:
+    """
+    Two-site DMRG for the ground state of a Hamiltonian in MPO form.
+    The left and right environments of bra-MPO-ket are cached and updated by one site
+    as the sweep moves on, and the local eigenproblem of each pair of sites is solved by Lanczos
+    with the effective Hamiltonian applied on the fly.
+
+    :Example:
+
+    >>> Jx = np.ones([9])
+    >>> Bz = -np.ones([10])
+    >>> tfi = tn.matrixproductstates.mpo.FiniteTFI(Jx, Bz, dtype=np.complex64)
+    >>> mpo = tc.quantum.tn2qop(tfi)
+    >>> energy, mps = tc.mpscircuit.dmrg(mpo, max_singular_values=16)
+
+    :param mpo: The Hamiltonian as MPO with open boundary, see ``quantum.tn2qop``
+    :type mpo: QuOperator
+    :param max_singular_values: The maximum bond dimension, defaults to 32
+    :type max_singular_values: int, optional
+    :param max_truncation_err: The maximum allowed truncation error, defaults to None
+    :type max_truncation_err: Optional[float], optional
+    :param num_sweeps: The maximum number of sweeps, one sweep goes back and forth, defaults to 10
+    :type num_sweeps: int, optional
+    :param tol: Stop when the energy changes less than ``tol`` within one sweep, defaults to 1e-8
+    :type tol: float, optional
+    :param num_krylov_vecs: The dimension of the Krylov space for the local Lanczos solver,
+        defaults to 20
+    :type num_krylov_vecs: int, optional
+    :param initial_state: The initial MPS, defaults to a random MPS with the maximum bond dimension
+    :type initial_state: Optional[MPSCircuit], optional
+    :return: The ground state energy and the ground state as ``MPSCircuit``,
+        with the truncation rule of the sweeps
+    :rtype: Tuple[Tensor, MPSCircuit]
+    """
+    ws = _mpo_tensors(mpo)
+    n = len(ws)
+    if initial_state is None:
+        dims = [min(max_singular_values, 2 ** min(i, n - i)) for i in range(n + 1)]
+        tensors = [
+            backend.cast(backend.implicit_randn([dims[i], 2, dims[i + 1]]), dtypestr)
+            for i in range(n)
+        ]
+        mps = MPSCircuit(n, tensors=tensors)
+    else:
+        mps = initial_state.copy()
+    mps.set_truncation_rule(
+        max_singular_values=max_singular_values, max_truncation_err=max_truncation_err
+    )
+    mps.position(0)
+    tensors = mps._mps.tensors
+    tensors[0] = tensors[0] / backend.norm(tensors[0])
+
+    edge = backend.ones([1, 1, 1], dtype=dtypestr)
+    lenvs: List[Tensor] = [edge] + [None] * (n - 1)
+    renvs: List[Tensor] = [None] * (n - 1) + [edge]
+    for i in range(n - 1, 0, -1):
+        renvs[i - 1] = _transfer_mpo_right(renvs[i], tensors[i], ws[i])
+
+    def update(i: int, right: bool) -> float:
+        l, w1, w2, r = lenvs[i], ws[i], ws[i + 1], renvs[i + 1]
+
+        def matvec(theta: Tensor) -> Tensor:
+            x = backend.einsum("akA,astb->kAstb", l, theta)
+            x = backend.einsum("kAstb,kSsK->AStbK", x, w1)
+            x = backend.einsum("AStbK,KTtm->ASTbm", x, w2)
+            return backend.einsum("ASTbm,bmB->ASTB", x, r)
+
+        theta = backend.einsum("asb,btc->astc", tensors[i], tensors[i + 1])
+        energy, theta = _lanczos_ground(matvec, theta, num_krylov_vecs)
+        d0, d1, d2, d3 = theta.shape
+        u, s, vh, _ = truncated_svd(
+            backend.reshape(theta, [d0 * d1, d2 * d3]),
+            max_singular_values=max_singular_values,
+            max_truncation_err=max_truncation_err,
+        )
+        s = s / backend.norm(s)
+        if right:
+            tensors[i] = backend.reshape(u, [d0, d1, -1])
+            tensors[i + 1] = backend.reshape(
+                backend.matmul(backend.diagflat(s), vh), [-1, d2, d3]
+            )
+            lenvs[i + 1] = _transfer_mpo_left(lenvs[i], tensors[i], ws[i])
+        else:
+            tensors[i] = backend.reshape(
+                backend.matmul(u, backend.diagflat(s)), [d0, d1, -1]
+            )
+            tensors[i + 1] = backend.reshape(vh, [-1, d2, d3])
+            renvs[i] = _transfer_mpo_right(renvs[i + 1], tensors[i + 1], ws[i + 1])
+        return energy
+
+    energy = None
+    for _ in range(num_sweeps):
+        previous = energy
+        for i in range(n - 1):
+            energy = update(i, right=True)
+        for i in range(n - 2, -1, -1):
+            energy = update(i, right=False)
+        if previous is not None and abs(energy - previous) < tol:
+            break
+    mps._mps.center_position = 0
+    return backend.convert_to_tensor(np.array(energy, dtype=rdtypestr)), mps
 
 
 MPSCircuit._meta_apply()
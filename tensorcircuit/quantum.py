@@ -1102,6 +1102,63 @@ def quimb2qop(qb_mpo: Any) -> QuOperator:
     return qop
 
 
+def _mpo_tensors(mpo: QuOperator) -> List[Tensor]:
+    """
+    Extract the MPO tensors from a ``QuOperator`` in MPO form,
+    e.g. from ``quantum.tn2qop`` or ``quantum.quimb2qop`` with open boundary.
+
+    :param mpo: The MPO
+    :type mpo: QuOperator
+    :raises ValueError: "The operator is not an MPO with open boundary"
+    :return: The MPO tensors with legs ``[k_left, out, in, k_right]``
+    :rtype: List[Tensor]
+    """
+    n = len(mpo.out_edges)
+    sites = [e.node1 for e in mpo.out_edges]
+    if len(mpo.in_edges) != n or [e.node1 for e in mpo.in_edges] != sites:
+        raise ValueError("The operator is not an MPO with open boundary")
+    if len(set(sites)) != n or len(mpo.nodes) != n:
+        raise ValueError("The operator is not an MPO with open boundary")
+    tensors = []
+    for i, node in enumerate(sites):
+        left, right = None, None
+        for j, e in enumerate(node.edges):
+            if e is mpo.out_edges[i] or e is mpo.in_edges[i]:
+                continue
+            if e.is_dangling():
+                # the trivial bonds at the ends
+                if e.dimension != 1 or 0 < i < n - 1:
+                    raise ValueError("The operator is not an MPO with open boundary")
+                side = "left" if i == 0 else "right"
+            else:
+                other = e.node2 if e.node1 is node else e.node1
+                if i > 0 and other is sites[i - 1]:
+                    side = "left"
+                elif i < n - 1 and other is sites[i + 1]:
+                    side = "right"
+                else:
+                    raise ValueError("The operator is not an MPO with open boundary")
+            if side == "left" and left is None:
+                left = j
+            elif side == "right" and right is None:
+                right = j
+            else:
+                raise ValueError("The operator is not an MPO with open boundary")
+        t = backend.cast(node.tensor, dtypestr)
+        axes = [mpo.out_edges[i].axis1, mpo.in_edges[i].axis1]
+        if left is not None:
+            axes = [left] + axes
+        if right is not None:
+            axes = axes + [right]
+        t = backend.transpose(t, axes)
+        if left is None:
+            t = t[None]
+        if right is None:
+            t = t[..., None]
+        tensors.append(t)
+    return tensors
+
+
 try:
     compiled_jit = partial(get_backend("tensorflow").jit, jit_compile=True)
     # TODO(@refraction-ray): at least make the final returned sparse tensor backend agnostic?
@@ -1756,6 +1813,180 @@ def double_state(h: Tensor, beta: float = 1) -> Tensor:
     return state / norm
 
 
+def _hamiltonian_matvec(hamiltonian: Any) -> Callable[[Tensor], Tensor]:
+    """
+    The matrix free action of the Hamiltonian on 1D state vectors, where the Hamiltonian
+    can be a dense matrix, a sparse matrix of the backend or a ``QuOperator`` MPO.
+    """
+    if isinstance(hamiltonian, QuOperator):
+        ws = _mpo_tensors(hamiltonian)
+
+        def matvec(v: Tensor) -> Tensor:
+            # legs of psi: MPO bond, sites done, current site, sites left
+            psi = backend.reshape(v, [1, 1, 2, -1])
+            for i, w in enumerate(ws):
+                psi = backend.einsum("alsr,aSsb->blSr", psi, w)
+                if i < len(ws) - 1:
+                    psi = backend.reshape(psi, [int(w.shape[-1]), 2 ** (i + 1), 2, -1])
+            return backend.reshape(psi, [-1])
+
+    elif backend.is_sparse(hamiltonian):
+
+        def matvec(v: Tensor) -> Tensor:
+            v = backend.reshape(v, [-1, 1])
+            return backend.reshape(backend.sparse_dense_matmul(hamiltonian, v), [-1])
+
+    else:
+
+        def matvec(v: Tensor) -> Tensor:
+            return backend.reshape(hamiltonian @ backend.reshape(v, [-1, 1]), [-1])
+
+    return matvec
+
+
+def _krylov_expm_step(
+    matvec: Callable[[Tensor], Tensor], v: Tensor, dt: Tensor, num_krylov_vecs: int
+) -> Tuple[Tensor, Tensor]:
+    """
+    :math:`e^{-iHdt}v` in the Krylov space spanned by the Lanczos vectors started from ``v``,
+    together with the a posteriori error estimate
+    :math:`\\beta h_{m+1, m} \\vert [e^{-iT_m dt}]_{m, 1}\\vert`.
+    """
+    m = num_krylov_vecs
+    beta = backend.real(backend.norm(v))
+    u = v / backend.cast(beta, dtypestr)
+    # basis of fixed shape, the rows not reached yet are zero
+    basis = backend.zeros([m, backend.sizen(v)], dtype=dtypestr)
+    alphas, betas = [], []
+    for j in range(m):
+        row = backend.convert_to_tensor(np.eye(m, dtype=npdtype)[:, j : j + 1])
+        basis += row * backend.reshape(u, [1, -1])
+        w = matvec(u)
+        alphas.append(backend.real(backend.sum(backend.conj(u) * w)))
+        # twice is enough for the orthogonality at small beta
+        for _ in range(2):
+            overlaps = backend.conj(basis) @ backend.reshape(w, [-1, 1])
+            w = w - backend.reshape(backend.reshape(overlaps, [1, -1]) @ basis, [-1])
+        b = backend.real(backend.norm(w))
+        betas.append(b)
+        # the new vector is dropped (zero) on an exact invariant subspace
+        u = w * backend.cast(b / (b**2 + 1e-30), dtypestr)
+    t = backend.diagflat(backend.stack(alphas))
+    if m > 1:
+        offdiag = backend.stack(betas[:-1])
+        t += backend.diagflat(offdiag, k=1) + backend.diagflat(offdiag, k=-1)
+    # T is real symmetric, the exponential via its eigendecomposition
+    e, u = backend.eigh(t)
+    coeff = backend.cast(backend.convert_to_tensor(dt), dtypestr) * (-1.0j)
+    u = backend.cast(u, dtypestr)
+    c = u @ (backend.exp(coeff * backend.cast(e, dtypestr)) * backend.conj(u[0]))
+    v = backend.reshape(backend.reshape(c, [1, -1]) @ basis, [-1])
+    err = beta * betas[-1] * backend.abs(c[-1])
+    return v * backend.cast(beta, dtypestr), err
+
+
+def _taylor_expm_step(
+    matvec: Callable[[Tensor], Tensor], v: Tensor, dt: Tensor, order: int
+) -> Tuple[Tensor, Tensor]:
+    """
+    :math:`e^{-iHdt}v` by the Taylor series truncated at ``order``,
+    together with the norm of the last term as the error estimate.
+    """
+    coeff = backend.cast(backend.convert_to_tensor(dt), dtypestr) * (-1.0j)
+    term = v
+    for k in range(1, order + 1):
+        term = matvec(term) * coeff / k
+        v = v + term
+    return v, backend.real(backend.norm(term))
+
+
+def evolve(
+    state: Tensor,
+    hamiltonian: Any,
+    t: Union[float, Tensor],
+    method: str = "krylov",
+    num_steps: Optional[int] = None,
+    num_krylov_vecs: int = 20,
+    taylor_order: int = 20,
+    tol: float = 1e-7,
+) -> Tensor:
+    """
+    Compute the time evolution :math:`e^{-iHt}\\vert\\psi\\rangle` without the matrix exponential
+    of the Hamiltonian, only the action of the Hamiltonian on vectors is used.
+    With ``method="krylov"``, each step exponentiates the projection onto the Lanczos basis
+    of ``num_krylov_vecs`` vectors; with ``method="taylor"``, each step sums the Taylor series
+    up to ``taylor_order`` with only two extra vectors in memory.
+
+    By default, the step sizes are adapted so that the error estimate of each step
+    stays below ``tol`` scaled by the step size over ``t``, which requires concrete values
+    (no jit). With ``num_steps`` given, ``t`` is divided into steps of equal size,
+    which works under jit and AD.
+
+    :Example:
+
+    >>> g = tc.templates.graphs.Line1D(10, pbc=False)
+    >>> h = tc.quantum.heisenberg_hamiltonian(g, hzz=1.0, hxx=1.0, hyy=1.0, hx=0.5)
+    >>> c = tc.Circuit(10)
+    >>> c.x(0)
+    >>> psi = tc.quantum.evolve(c.state(), h, 2.0)
+    >>> evolve = tc.backend.jit(lambda psi, t: tc.quantum.evolve(psi, h, t, num_steps=10))
+    >>> psi = evolve(c.state(), 2.0)
+
+    :param state: The initial state
+    :type state: Tensor
+    :param hamiltonian: The Hamiltonian as a sparse matrix (e.g. from ``PauliStringSum2COO``
+        or ``heisenberg_hamiltonian``), a ``QuOperator`` MPO or a dense matrix
+    :type hamiltonian: Any
+    :param t: The evolution time
+    :type t: Union[float, Tensor]
+    :param method: "krylov" or "taylor", defaults to "krylov"
+    :type method: str, optional
+    :param num_steps: The number of equal steps, defaults to None (adaptive step sizes)
+    :type num_steps: Optional[int], optional
+    :param num_krylov_vecs: The dimension of the Krylov space, defaults to 20
+    :type num_krylov_vecs: int, optional
+    :param taylor_order: The order of the Taylor series, defaults to 20
+    :type taylor_order: int, optional
+    :param tol: The error tolerance for the adaptive step sizes, defaults to 1e-7
+    :type tol: float, optional
+    :raises ValueError: "Unknown evolution method: %s"
+    :return: The evolved state in the same shape as ``state``
+    :rtype: Tensor
+    """
+    matvec = _hamiltonian_matvec(hamiltonian)
+    if method == "krylov":
+        step = partial(_krylov_expm_step, matvec, num_krylov_vecs=num_krylov_vecs)
+        order = num_krylov_vecs
+    elif method == "taylor":
+        step = partial(_taylor_expm_step, matvec, order=taylor_order)
+        order = taylor_order + 1
+    else:
+        raise ValueError("Unknown evolution method: %s" % method)
+    shape = list(state.shape)
+    v = backend.cast(backend.reshape(state, [-1]), dtypestr)
+    if num_steps is not None:
+        for _ in range(num_steps):
+            v, _ = step(v, t / num_steps)
+        return backend.reshape(v, shape)
+
+    t = float(backend.numpy(backend.convert_to_tensor(t)))
+    done = 0.0
+    dt = t
+    while abs(t - done) > 1e-12 * abs(t):
+        dt = min(abs(dt), abs(t - done)) * np.sign(t)
+        v1, err = step(v, dt)
+        err = float(backend.numpy(err))
+        allowed = tol * abs(dt / t)
+        if not np.isfinite(err) or err > allowed:
+            factor = 0.1 if not np.isfinite(err) else (allowed / err) ** (1 / order)
+            dt *= max(0.1, 0.9 * factor)
+            continue
+        v = v1
+        done += dt
+        dt *= min(5.0, 0.9 * (allowed / (err + 1e-30)) ** (1 / order))
+    return backend.reshape(v, shape)
+
+
 @op2tensor
 def mutual_information(s: Tensor, cut: Union[int, List[int]]) -> Tensor:
     """
@@ -1796,6 +2027,76 @@ def mutual_information(s: Tensor, cut: Union[int, List[int]]) -> Tensor:
     return ha + hb - hab
 
 
+def _schmidt_split(m: Tensor) -> Tuple[Tensor, Tensor, Tensor]:
+    u, s, vh, _ = backend.svd(m)
+    s = backend.cast(s, dtypestr)
+    return u, s / backend.norm(s), vh
+
+
+def entanglement_profile(state: Any) -> List[Tensor]:
+    """
+    Compute the Schmidt spectrum for all contiguous bipartitions of a pure state,
+    the ``i``-th element of the returned list is the spectrum between qubits
+    :math:`[0, i]` and :math:`[i+1, n-1]`.
+    The spectra are obtained by one sweep of SVDs of shrinking matrices instead of
+    one reduced density matrix diagonalization per cut.
+    For ``MPSCircuit`` input, the sweep starts from the orthogonality center and each
+    step costs :math:`O(\\chi^3)`, the MPS itself is left untouched.
+
+    :Example:
+
+    >>> c = tc.Circuit(4)
+    >>> c.h(0)
+    >>> c.cnot(0, 1)
+    >>> spectra = tc.quantum.entanglement_profile(c.state())
+    >>> [tc.backend.numpy(s).round(4) for s in spectra]
+    [array([0.7071, 0.7071], dtype=float32), array([1., 0., 0., 0.], dtype=float32),
+    array([1., 0.], dtype=float32)]
+    >>> entropies = [-tc.backend.sum(s**2 * tc.backend.log(s**2 + 1e-12)) for s in spectra]
+
+    :param state: The pure state as a wavefunction tensor or a ``MPSCircuit``.
+    :type state: Any
+    :return: The list of :math:`n-1` normalized Schmidt spectra in descending order.
+    :rtype: List[Tensor]
+    """
+    spectra = []
+    if hasattr(state, "_mps"):  # MPSCircuit
+        if state._mps.center_position is None:
+            state.position(0)
+        tensors = state._mps.tensors
+        n = len(tensors)
+        center = state._mps.center_position
+        spectra = [None for _ in range(n - 1)]
+        # sites right of the center are right canonical
+        t = tensors[center]
+        for i in range(center, n - 1):
+            l, d, r = t.shape
+            _, s, vh = _schmidt_split(backend.reshape(t, [l * d, r]))
+            spectra[i] = backend.real(s)
+            t = backend.einsum(
+                "ab,bsc->asc", backend.reshape(s, [-1, 1]) * vh, tensors[i + 1]
+            )
+        # sites left of the center are left canonical
+        t = tensors[center]
+        for i in range(center, 0, -1):
+            l, d, r = t.shape
+            u, s, _ = _schmidt_split(backend.reshape(t, [l, d * r]))
+            spectra[i - 1] = backend.real(s)
+            t = backend.einsum(
+                "asb,bc->asc", tensors[i - 1], u * backend.reshape(s, [1, -1])
+            )
+        return spectra  # type: ignore
+
+    state = backend.reshape(state, [-1])
+    n = int(np.round(np.log2(state.shape[0])))
+    m = backend.reshape(state, [2, -1])
+    for _ in range(n - 1):
+        _, s, vh = _schmidt_split(m)
+        spectra.append(backend.real(s))
+        m = backend.reshape(backend.reshape(s, [-1, 1]) * vh, [s.shape[0] * 2, -1])
+    return spectra
+
+
 def measurement_counts(
     state: Tensor, counts: int = 8192, sparse: bool = True
 ) -> Union[Tuple[Tensor, Tensor], Tensor]:
@@ -3,9 +3,10 @@ Shortcuts for measurement patterns on circuit
 """
 # circuit in, scalar out
 
-from typing import Any
+from typing import Any, List, Union
 
 from ..circuit import Circuit
+from ..mpscircuit import MPSCircuit
 from ..cons import backend, dtypestr
 from ..quantum import QuOperator
 from .. import gates as G
@@ -121,23 +122,35 @@ def sparse_expectation(c: Circuit, hamiltonian: Tensor) -> Tensor:
     return backend.real(expt)[0, 0]
 
 
-def mpo_expectation(c: Circuit, mpo: QuOperator) -> Tensor:
+def mpo_expectation(c: Union[Circuit, MPSCircuit], mpo: QuOperator) -> Tensor:
     """
     Evaluate expectation of operator ``mpo`` defined in ``QuOperator`` MPO format
     with the output quantum state from circuit ``c``.
+    For ``MPSCircuit``, the zipper contraction ``MPSCircuit.expectation_mpo`` is used.
 
     :param c: The circuit for the output state
-    :type c: Circuit
+    :type c: Union[Circuit, MPSCircuit]
     :param mpo: MPO operator
     :type mpo: QuOperator
     :return: a real and scalar tensor of shape [] as the expectation value
     :rtype: Tensor
     """
+    if isinstance(c, MPSCircuit):
+        return backend.real(c.expectation_mpo(mpo))
     mps = c.get_quvector()
     e = (mps.adjoint() @ mpo @ mps).eval_matrix()
     return backend.real(e)[0, 0]
 
 
+def _weighted_batch(c: Circuit, weights: List[float], ops_list: List[Any]) -> Tensor:
+    loss = 0.0
+    if ops_list:
+        values = c.expectation_batch(ops_list)  # type: ignore
+        for i, w in enumerate(weights):
+            loss += w * values[i]
+    return backend.real(loss)
+
+
 def heisenberg_measurements(
     c: Circuit,
     g: Graph,
@@ -188,6 +201,19 @@ def heisenberg_measurements(
     :return: Value of Heisenberg energy
     :rtype: Tensor
     """
+    if reuse and isinstance(c, Circuit):
+        weights = []
+        ops_list = []
+        for e in g.edges:
+            for h, op in [(hzz, G.z), (hyy, G.y), (hxx, G.x)]:
+                weights.append(g[e[0]][e[1]]["weight"] * h)
+                ops_list.append([(op(), [e[0]]), (op(), [e[1]])])
+        for h, op in [(hx, G.x), (hy, G.y), (hz, G.z)]:
+            if h != 0:
+                for i in range(len(g.nodes)):
+                    weights.append(h)
+                    ops_list.append([(op(), [i])])
+        return _weighted_batch(c, weights, ops_list)
     loss = 0.0
     for e in g.edges:
         loss += (
@@ -255,6 +281,16 @@ def spin_glass_measurements(c: Circuit, g: Graph, reuse: bool = True) -> Tensor:
     :return: The spin glass energy expectation value
     :rtype: Tensor
     """
+    if reuse and isinstance(c, Circuit):
+        weights = []
+        ops_list = []
+        for e1, e2 in g.edges:
+            weights.append(g[e1][e2].get("weight", 1.0))
+            ops_list.append([(G.z(), [e1]), (G.z(), [e2])])
+        for n in g.nodes:
+            weights.append(g.nodes[n].get("weight", 0.0))
+            ops_list.append([(G.z(), [n])])
+        return _weighted_batch(c, weights, ops_list)
     loss = 0
     for e1, e2 in g.edges:
         loss += g[e1][e2].get("weight", 1.0) * c.expectation(
@@ -236,6 +236,114 @@ def test_expectation():
     assert np.allclose(c.expectation((tc.gates.z(), [0])), 0, atol=1e-7)
 
 
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_local_rdms(backend):
+    n = 5
+    c = tc.Circuit(n)
+    for i in range(n):
+        c.rx(i, theta=0.3 * (i + 1))
+    for i in range(n - 1):
+        c.cnot(i, i + 1)
+    c.ry(2, theta=0.7)
+    w = c.wavefunction()
+    pairs = [(0, 1), (3, 1), (2, 4)]
+    rho1, rho2 = c.local_rdms(pairs=pairs)
+    assert rho1.shape == (n, 2, 2)
+    assert rho2.shape == (len(pairs), 4, 4)
+    for i in range(n):
+        traceout = [j for j in range(n) if j != i]
+        np.testing.assert_allclose(
+            rho1[i], tc.quantum.reduced_density_matrix(w, traceout), atol=1e-5
+        )
+    xm, ym, zm = tc.gates._x_matrix, tc.gates._y_matrix, tc.gates._z_matrix
+    for k, (i, j) in enumerate(pairs):
+        for pa, pb in [(xm, xm), (xm, zm), (ym, zm), (zm, zm)]:
+            np.testing.assert_allclose(
+                np.trace(tc.backend.numpy(rho2[k]) @ np.kron(pa, pb)),
+                c.expectation((pa, [i]), (pb, [j])),
+                atol=1e-5,
+            )
+
+    rho1, rho2 = c.local_rdms(sites=[2], reuse=False)
+    assert rho1.shape == (1, 2, 2)
+    assert rho2 is None
+
+    @tc.backend.jit
+    def f(theta):
+        c = tc.Circuit(3)
+        c.rx(0, theta=theta)
+        c.cnot(0, 2)
+        return c.local_rdms(pairs=[(0, 2)])
+
+    rho1, rho2 = f(tc.backend.convert_to_tensor(np.float32(0.4)))
+    np.testing.assert_allclose(rho1[1], np.diag([1, 0]), atol=1e-5)
+    np.testing.assert_allclose(rho2[0, 1:3, :], 0, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        c.local_rdms(pairs=[(1, 1)])
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_expectation_batch(backend):
+    def circuit(theta):
+        c = tc.Circuit(4)
+        for i in range(4):
+            c.rx(i, theta=theta * (i + 1))
+        for i in range(3):
+            c.cnot(i, i + 1)
+        c.ry(0, theta=theta)
+        return c
+
+    x, y, z = tc.gates._x_matrix, tc.gates._y_matrix, tc.gates._z_matrix
+    cnot = tc.gates._cnot_matrix
+    ops_list = [
+        [(tc.gates.z(), [0])],
+        [(x, [1])],
+        [(y, [3])],
+        [(z, [0]), (z, [1])],
+        [(z, [1]), (z, [0])],
+        [(x, [3]), (y, [1]), (z, [2])],
+        [(cnot, [2, 0])],
+        [(cnot, [2, 0]), (x, 3)],
+    ]
+    c = circuit(0.3)
+    w = c.wavefunction()
+    values = c.expectation_batch(ops_list)
+    assert values.shape == (len(ops_list),)
+    for v, ops in zip(values, ops_list):
+        c1 = tc.Circuit(4, inputs=w)
+        for op, index in ops:
+            if isinstance(op, tc.gates.Gate):
+                op = op.tensor
+            index = [index] if isinstance(index, int) else index
+            c1.any(*index, unitary=tc.array_to_tensor(tc.backend.reshapem(op)))
+        np.testing.assert_allclose(
+            v, tc.backend.sum(tc.backend.conj(w) * c1.wavefunction()), atol=1e-5
+        )
+
+    # terms without y are symmetric, where ``expectation`` agrees term by term
+    sym_list = [ops_list[i][:] for i in [1, 3, 4, 6, 7]]
+
+    @tc.backend.jit
+    def f(theta):
+        c = circuit(theta)
+        return tc.backend.real(tc.backend.sum(c.expectation_batch(sym_list)))
+
+    def g(theta):
+        c = circuit(theta)
+        return tc.backend.real(sum([c.expectation(*ops) for ops in sym_list]))
+
+    theta = tc.backend.convert_to_tensor(np.float32(0.7))
+    np.testing.assert_allclose(f(theta), g(theta), atol=1e-5)
+    if tc.backend.name != "numpy":
+        np.testing.assert_allclose(
+            tc.backend.grad(f)(theta), tc.backend.grad(g)(theta), atol=1e-4
+        )
+
+    with pytest.raises(ValueError):
+        c.expectation_batch([[(z, [0]), (x, [0, 1])]])
+
+
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_exp1(backend):
     @partial(tc.backend.jit, jit_compile=True)
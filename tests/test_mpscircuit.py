@@ -236,3 +236,335 @@ def test_circuits_1(backend, dtype):
 def test_circuits_2(highp):
     circuits = get_test_circuits(True)
     do_test_truncation(circuits, 0.9705050538783289, 0.984959108658121)
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_mps_sample(backend, highp):
+    mps = tc.MPSCircuit(4)
+    mps.H(0)
+    mps.CNOT(0, 1)
+    mps.rx(2, theta=0.7)
+    mps.CNOT(2, 3)
+    w = tc.backend.numpy(mps.wavefunction())
+    samples, p = mps.sample(4096, with_prob=True)
+    np.testing.assert_allclose(tc.backend.numpy(mps.wavefunction()), w, atol=1e-10)
+    samples = tc.backend.numpy(samples)
+    assert samples.shape == (4096, 4)
+    probs = np.abs(tc.backend.numpy(mps.wavefunction())) ** 2
+    index = samples @ np.array([8, 4, 2, 1])
+    np.testing.assert_allclose(tc.backend.numpy(p), probs[index], atol=1e-6)
+    freq = np.bincount(index, minlength=16) / 4096
+    np.testing.assert_allclose(freq, probs, atol=0.05)
+    samples, p = mps.sample(8)
+    assert tc.backend.numpy(samples).shape == (8, 4)
+    assert p == -1.0
+
+
+def _apply_dense(psi, op, index):
+    op = np.reshape(op, [2] * (2 * len(index)))
+    m = len(index)
+    phi = np.tensordot(op, psi, axes=[list(range(m, 2 * m)), index])
+    return np.moveaxis(phi, list(range(m)), index)
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_mps_expectation_batch(backend, highp):
+    n = 6
+    mps = tc.MPSCircuit(n)
+    for i in range(n):
+        mps.rx(i, theta=0.3 * i + 0.1)
+        mps.ry(i, theta=0.2)
+    for i in range(n - 1):
+        mps.cnot(i, i + 1)
+    mps.position(3)
+    psi = np.reshape(tc.backend.numpy(mps.wavefunction()), [2] * n)
+    x, y, z = tc.gates.x(), tc.gates.y(), tc.gates.z()
+    terms = [[(g, [i]), (g, [i + 1])] for i in range(n - 1) for g in [x, y, z]]
+    terms += [[(y, [1])], [(y, [1]), (x, [4])], [(tc.gates.cnot(), [3, 2])]]
+    values = tc.backend.numpy(mps.expectation_batch(terms))
+    for v, term in zip(values, terms):
+        phi = psi
+        for g, index in term:
+            phi = _apply_dense(phi, tc.backend.numpy(g.tensor), index)
+        np.testing.assert_allclose(v, np.vdot(psi, phi), atol=1e-10)
+    # environments are refreshed once the state changes
+    mps.x(2)
+    psi = np.reshape(tc.backend.numpy(mps.wavefunction()), [2] * n)
+    phi = _apply_dense(psi, tc.backend.numpy(z.tensor), [2])
+    np.testing.assert_allclose(
+        mps.expectation_single_gate(z, 2), np.vdot(psi, phi), atol=1e-10
+    )
+    np.testing.assert_allclose(
+        mps.expectation_two_gates_product(z, z, 0, 5),
+        mps.general_expectation((z, [0]), (z, [5])),
+        atol=1e-10,
+    )
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_mps_long_range_mpo(backend, highp):
+    n = 7
+    c = tc.Circuit(n)
+    mps_swap = tc.MPSCircuit(n)
+    mps_mpo = tc.MPSCircuit(n)
+    mps_mpo.set_long_range_method("mpo")
+    for k in [c, mps_swap, mps_mpo]:
+        for i in range(n):
+            k.rx(i, theta=0.3 * i + 0.1)
+            k.ry(i, theta=0.2)
+        k.cnot(0, 5)
+        k.cnot(6, 1)
+        k.exp1(2, 6, theta=0.3, unitary=tc.gates._xx_matrix)
+        k.cz(3, 4)
+    w = tc.backend.numpy(c.wavefunction())
+    np.testing.assert_allclose(tc.backend.numpy(mps_swap.wavefunction()), w, atol=1e-10)
+    np.testing.assert_allclose(tc.backend.numpy(mps_mpo.wavefunction()), w, atol=1e-10)
+    assert mps_mpo.is_valid()
+    # with truncation, the fidelity estimation is consistent with the real one
+    mps = tc.MPSCircuit(n)
+    mps.set_truncation_rule(max_singular_values=2)
+    mps.set_long_range_method("mpo")
+    for i in range(n):
+        mps.rx(i, theta=0.3 * i + 0.1)
+        mps.ry(i, theta=0.2)
+    mps.cnot(0, 5)
+    mps.cnot(6, 1)
+    w_mps = tc.backend.numpy(mps.wavefunction())
+    c = tc.Circuit(n)
+    for i in range(n):
+        c.rx(i, theta=0.3 * i + 0.1)
+        c.ry(i, theta=0.2)
+    c.cnot(0, 5)
+    c.cnot(6, 1)
+    w = tc.backend.numpy(c.wavefunction())
+    real_fidelity = np.abs(np.vdot(w_mps, w)) ** 2 / np.vdot(w_mps, w_mps).real
+    assert real_fidelity < 1 - 1e-4
+    np.testing.assert_allclose(real_fidelity, mps._fidelity, atol=5e-2)
+
+
+def test_mps_apply_layer(highp):
+    n = 7
+    c = tc.Circuit(n)
+    mps = tc.MPSCircuit(n, center_position=n - 1)
+    u = tc.gates.random_two_qubit_gate().tensor
+    for i in range(n):
+        c.ry(i, theta=0.1 * i)
+        mps.ry(i, theta=0.1 * i)
+    for i in range(0, n - 1, 2):
+        c.any(i, i + 1, unitary=u)
+    for i in range(1, n - 1, 2):
+        c.cnot(i + 1, i)
+    mps.apply_layer(tc.gates.any(u), [(i, i + 1) for i in range(0, n - 1, 2)])
+    mps.apply_layer(
+        [tc.gates.cnot() for _ in range(1, n - 1, 2)],
+        [(i + 1, i) for i in range(1, n - 1, 2)],
+    )
+    np.testing.assert_allclose(
+        tc.backend.numpy(mps.wavefunction()),
+        tc.backend.numpy(c.wavefunction()),
+        atol=1e-10,
+    )
+    with pytest.raises(ValueError):
+        mps.apply_layer(tc.gates.cnot(), [(0, 1), (1, 2)])
+
+
+@pytest.mark.parametrize("backend", [lf("tfb"), lf("jaxb")])
+def test_mps_fixed_bond_dimension(backend, highp):
+    n = 6
+
+    def build(param, fixed, err=None):
+        mps = tc.MPSCircuit(n)
+        mps.set_truncation_rule(
+            max_singular_values=3, max_truncation_err=err, fixed_bond_dimension=fixed
+        )
+        for j in range(2):
+            for i in range(n):
+                mps.rx(i, theta=param[j, i])
+            for i in range(n - 1):
+                mps.exp1(i, i + 1, theta=param[j, i], unitary=tc.gates._zz_matrix)
+            mps.cnot(0, 4)
+        return mps
+
+    def f(param, fixed=True, err=None):
+        mps = build(param, fixed, err)
+        return tc.backend.real(mps.expectation_single_gate(tc.gates.z(), 3))
+
+    param = tc.backend.convert_to_tensor(np.random.RandomState(1).randn(2, n))
+    mps = build(param, True)
+    assert mps.is_valid()
+    assert [tuple(t.shape) for t in mps._mps.tensors] == [
+        (1, 2, 2),
+        (2, 2, 3),
+        (3, 2, 3),
+        (3, 2, 3),
+        (3, 2, 2),
+        (2, 2, 1),
+    ]
+    np.testing.assert_allclose(
+        tc.backend.numpy(mps.wavefunction()),
+        tc.backend.numpy(build(param, False).wavefunction()),
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(mps._fidelity, build(param, False)._fidelity)
+
+    expected = f(param, False)
+    np.testing.assert_allclose(tc.backend.jit(f)(param), expected, atol=1e-10)
+    params = tc.backend.stack([param, 0.5 * param])
+    np.testing.assert_allclose(
+        tc.backend.vmap(f)(params),
+        [expected, f(0.5 * param, False)],
+        atol=1e-10,
+    )
+    v, g = tc.backend.jit(tc.backend.vvag(f))(params)
+    np.testing.assert_allclose(v[0], expected, atol=1e-10)
+    assert g.shape == params.shape
+    if tc.backend.name == "jax":
+        # tf vectorization falls back to the built-in decomposition gradients,
+        # which are not safe for the zero padded bonds
+        assert np.all(np.isfinite(tc.backend.numpy(g)))
+
+    # the truncation error only zeros out singular values in the fixed mode
+    f2 = lambda param: f(param, err=1e-2)
+    np.testing.assert_allclose(
+        tc.backend.jit(f2)(param), f(param, False, err=1e-2), atol=1e-10
+    )
+    with pytest.raises(ValueError):
+        tc.MPSCircuit(n).set_truncation_rule(fixed_bond_dimension=True)
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_mps_randomized_svd(backend, highp):
+    from tensorcircuit.mps_base import truncated_svd
+
+    a = np.random.normal(size=[64, 48]) @ np.diag(np.exp(-np.arange(48) / 4.0))
+    a = tc.backend.convert_to_tensor(a.astype(np.complex128))
+    u, s, vh, err = truncated_svd(a, max_singular_values=10, svd_method="randomized")
+    s_exact = np.linalg.svd(tc.backend.numpy(a), compute_uv=False)
+    np.testing.assert_allclose(tc.backend.numpy(s).real, s_exact[:10], rtol=1e-3)
+    np.testing.assert_allclose(
+        np.sum(np.abs(tc.backend.numpy(err)) ** 2),
+        np.sum(s_exact[10:] ** 2),
+        rtol=1e-2,
+    )
+    fidelity = {}
+    for method in ["svd", "randomized"]:
+        # the bond dimension is large enough for the sketch to be smaller than the matrix
+        mps = tc.MPSCircuit(12)
+        mps.set_truncation_rule(max_singular_values=12, svd_method=method)
+        for d in range(10):
+            for i in range(12):
+                mps.rx(i, theta=0.3 + 0.1 * i)
+                mps.ry(i, theta=0.2)
+            mps.apply_layer(tc.gates.cnot(), [(i, i + 1) for i in range(d % 2, 11, 2)])
+        fidelity[method] = np.real(tc.backend.numpy(mps._fidelity))
+    assert fidelity["svd"] < 1 - 1e-3
+    np.testing.assert_allclose(fidelity["randomized"], fidelity["svd"], rtol=1e-2)
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_mps_from_circuit(backend, highp):
+    n = 7
+    c = tc.Circuit(n)
+    for i in range(n):
+        c.h(i)
+        c.rx(i, theta=0.2 * i)
+    c.toffoli(0, 4, 2)
+    c.cnot(6, 1)
+    c.multicontrol(1, 3, 5, ctrl=[1, 0], unitary=tc.gates._x_matrix)
+    c.exp1(0, 6, theta=0.3, unitary=tc.gates._zz_matrix)
+    w = tc.backend.numpy(c.wavefunction())
+    for method in ["swap", "mpo"]:
+        mps = tc.MPSCircuit.from_circuit(c, long_range_method=method)
+        np.testing.assert_allclose(tc.backend.numpy(mps.wavefunction()), w, atol=1e-10)
+    for j in range(3):
+        for i in range(n - 1):
+            c.exp1(i, i + 1, theta=0.3 * i + 0.2 * j, unitary=tc.gates._xx_matrix)
+            c.ry(i, theta=0.5)
+    w = tc.backend.numpy(c.wavefunction())
+    mps = tc.MPSCircuit.from_circuit(c, max_singular_values=2)
+    assert mps._fidelity < 1 - 1e-3
+    w_mps = tc.backend.numpy(mps.wavefunction())
+    assert np.abs(np.vdot(w_mps, w)) ** 2 < 1 - 1e-3
+    # dense inputs with a global phase
+    w = np.random.normal(size=[2**5]) + 1.0j * np.random.normal(size=[2**5])
+    w /= np.linalg.norm(w)
+    c = tc.Circuit(5, inputs=w)
+    c.cnot(0, 3)
+    mps = tc.MPSCircuit.from_circuit(c)
+    np.testing.assert_allclose(
+        tc.backend.numpy(mps.wavefunction()),
+        tc.backend.numpy(c.wavefunction()),
+        atol=1e-10,
+    )
+    c = tc.Circuit(2)
+    c.h(0)
+    c.cnot(0, 1)
+    with pytest.raises(ValueError):
+        tc.MPSCircuit.from_circuit(tc.Circuit(2, mps_inputs=c.quvector()))
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_dmrg(backend, highp):
+    import tensornetwork as tn
+
+    n = 8
+    Jx = np.ones([n - 1])
+    Bz = -0.7 * np.ones([n])
+    mpo = tc.quantum.tn2qop(
+        tn.matrixproductstates.mpo.FiniteTFI(Jx, Bz, dtype=np.complex128)
+    )
+    h = tc.backend.numpy(mpo.copy().eval_matrix())
+    e0 = np.linalg.eigvalsh(h)[0]
+    energy, mps = tc.mpscircuit.dmrg(mpo, max_singular_values=16)
+    np.testing.assert_allclose(energy, e0, atol=1e-8)
+    w = tc.backend.numpy(mps.wavefunction())
+    np.testing.assert_allclose(np.linalg.norm(w), 1.0, atol=1e-8)
+    np.testing.assert_allclose(np.vdot(w, h @ w), e0, atol=1e-8)
+    # truncated ground state is variational
+    energy, mps = tc.mpscircuit.dmrg(mpo, max_singular_values=2, initial_state=mps)
+    w = tc.backend.numpy(mps.wavefunction())
+    assert np.real(np.vdot(w, h @ w)) > e0
+    np.testing.assert_allclose(np.vdot(w, h @ w), energy, atol=1e-2)
+    with pytest.raises(ValueError):
+        tc.mpscircuit.dmrg(
+            tc.quantum.QuOperator.from_tensor(np.eye(4).reshape([2] * 4))
+        )
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_mps_expectation_mpo(backend, highp):
+    import tensornetwork as tn
+
+    n = 8
+    mpo = tc.quantum.tn2qop(
+        tn.matrixproductstates.mpo.FiniteXXZ(
+            np.ones([n - 1]),
+            0.5 * np.ones([n - 1]),
+            0.3 * np.ones([n]),
+            dtype=np.complex128,
+        )
+    )
+    h = tc.backend.numpy(mpo.copy().eval_matrix())
+    c = tc.Circuit(n)
+    for i in range(n):
+        c.rx(i, theta=0.3 * i)
+    for i in range(n - 1):
+        c.exp1(i, i + 1, theta=0.2 * i + 0.1, unitary=tc.gates._xx_matrix)
+    mps = tc.MPSCircuit.from_circuit(c)
+    w = tc.backend.numpy(c.wavefunction())
+    np.testing.assert_allclose(mps.expectation_mpo(mpo), np.vdot(w, h @ w), atol=1e-10)
+    lenvs = mps._mpo_env_cache[-1]
+    # only the environments after the updated site are recomputed
+    mps.ry(n - 2, theta=0.7)
+    c.ry(n - 2, theta=0.7)
+    w = tc.backend.numpy(c.wavefunction())
+    np.testing.assert_allclose(mps.expectation_mpo(mpo), np.vdot(w, h @ w), atol=1e-10)
+    assert all([a is b for a, b in zip(lenvs[: n - 1], mps._mpo_env_cache[-1])])
+    assert mps._mpo_env_cache[-1][n - 1] is not lenvs[n - 1]
+    np.testing.assert_allclose(
+        tc.templates.measurements.mpo_expectation(mps, mpo),
+        np.real(np.vdot(w, h @ w)),
+        atol=1e-10,
+    )
+    with pytest.raises(ValueError):
+        tc.MPSCircuit(n - 1).expectation_mpo(mpo)
@@ -261,6 +261,49 @@ def test_rm_state_vs_mps(backend):
     np.testing.assert_allclose(rm1, rm2, atol=atol)
 
 
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_entanglement_profile(backend):
+    n = 6
+    param = tc.backend.convert_to_tensor(
+        np.random.uniform(size=[4, n]).astype(np.float32)
+    )
+    c = tc.Circuit(n)
+    c = tc.templates.blocks.example_block(c, param, 2)
+    w = c.wavefunction()
+    spectra = qu.entanglement_profile(w)
+    assert len(spectra) == n - 1
+    for i, s in enumerate(spectra):
+        s = tc.backend.numpy(s)
+        np.testing.assert_allclose(np.sum(s**2), 1.0, atol=atol)
+        p = s**2
+        e = -np.sum(p * np.log(p + 1e-12))
+        rm = qu.reduced_density_matrix(w, i + 1)
+        np.testing.assert_allclose(e, qu.entropy(rm), atol=1e-4)
+
+    mps = tc.MPSCircuit.from_wavefunction(w)
+    for center in [0, 3, n - 1]:
+        mps.position(center)
+        tensors = list(mps._mps.tensors)
+        spectra_mps = qu.entanglement_profile(mps)
+        assert mps._mps.center_position == center
+        assert all(t1 is t2 for t1, t2 in zip(tensors, mps._mps.tensors))
+        for s1, s2 in zip(spectra, spectra_mps):
+            s1 = tc.backend.numpy(s1)
+            s2 = tc.backend.numpy(s2)
+            np.testing.assert_allclose(s1[: len(s2)], s2, atol=atol)
+            np.testing.assert_allclose(s1[len(s2) :], 0, atol=atol)
+
+    entropies = tc.backend.jit(
+        lambda w: tc.backend.stack(
+            [
+                -tc.backend.sum(s**2 * tc.backend.log(s**2 + 1e-12))
+                for s in qu.entanglement_profile(w)
+            ]
+        )
+    )(w)
+    assert entropies.shape == (n - 1,)
+
+
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_trace_product(backend):
     o = np.ones([2, 2])
@@ -156,3 +156,27 @@ def test_operator_measurement(backend):
 
         np.testing.assert_allclose(v, 0.84147, atol=1e-4)
         np.testing.assert_allclose(g, 0.54032, atol=1e-4)
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_lattice_measurements_batch(backend):
+    g = tc.templates.graphs.Line1D(4)
+    for e in g.edges:
+        g.nodes[e[0]]["weight"] = 0.5
+    c = tc.Circuit(4)
+    for i in range(4):
+        c.rx(i, theta=0.2 * (i + 1))
+    c.cnot(0, 1)
+    c.cnot(2, 3)
+    c.ry(1, theta=0.4)
+    for kws in [{}, {"hx": 0.3, "hz": -0.5}]:
+        np.testing.assert_allclose(
+            tc.templates.measurements.heisenberg_measurements(c, g, **kws),
+            tc.templates.measurements.heisenberg_measurements(c, g, reuse=False, **kws),
+            atol=1e-5,
+        )
+    np.testing.assert_allclose(
+        tc.templates.measurements.spin_glass_measurements(c, g),
+        tc.templates.measurements.spin_glass_measurements(c, g, reuse=False),
+        atol=1e-5,
+    )